@@ -20,15 +20,11 @@ throughout the library.
 import sys
 import platform
 import json
+from collections.abc import Sequence
 
 from ._2to3 import LONGTYPE, STRTYPE, NONETYPE, UNITYPE, iteritems_
 from .error import CloudantArgumentError, CloudantException, CloudantClientException
 
-try:
-    from collections.abc import Sequence
-except ImportError:
-    from collections import Sequence
-
 # Library Constants
 
 DESIGN_PREFIX = '_design/'
@@ -76,14 +72,13 @@ RESULT_ARG_TYPES = {
     'update': (STRTYPE,),
 }
 
-# pylint: disable=unnecessary-lambda
 TYPE_CONVERTERS = {
-    STRTYPE: lambda x: json.dumps(x),
-    str: lambda x: json.dumps(x),
-    UNITYPE: lambda x: json.dumps(x),
-    Sequence: lambda x: json.dumps(list(x)),
-    list: lambda x: json.dumps(x),
-    tuple: lambda x: json.dumps(list(x)),
+    STRTYPE: json.dumps,
+    str: json.dumps,
+    UNITYPE: json.dumps,
+    Sequence: lambda x: json.dumps(x if isinstance(x, list) else list(x)),
+    list: json.dumps,
+    tuple: json.dumps,  # encoded as a JSON array like a list
     int: lambda x: x,
     LONGTYPE: lambda x: x,
     bool: lambda x: 'true' if x else 'false',
@@ -179,31 +174,25 @@ def python_to_couch(options, encoder=None):
     """
     translation = dict()
     for key, val in iteritems_(options):
-        py_to_couch_validate(key, val)
-        translation.update(_py_to_couch_translate(key, val, encoder))
+        handler = _RESULT_ARG_HANDLERS.get(key)
+        if handler is None:
+            raise CloudantArgumentError(116, key)
+        validate, translate = handler
+        validate(val)
+        try:
+            translation[key] = translate(val, encoder)
+        except Exception as ex:
+            raise CloudantArgumentError(136, key, ex)
     return translation
 
 def py_to_couch_validate(key, val):
     """
     Validates the individual parameter key and value.
     """
-    if key not in RESULT_ARG_TYPES:
+    handler = _RESULT_ARG_HANDLERS.get(key)
+    if handler is None:
         raise CloudantArgumentError(116, key)
-    # pylint: disable=unidiomatic-typecheck
-    # Validate argument values and ensure that a boolean is not passed in
-    # if an integer is expected
-    if (not isinstance(val, RESULT_ARG_TYPES[key]) or
-            (type(val) is bool and bool not in RESULT_ARG_TYPES[key] and
-             int in RESULT_ARG_TYPES[key])):
-        raise CloudantArgumentError(117, key, RESULT_ARG_TYPES[key])
-    if key == 'keys':
-        for key_list_val in val:
-            if (not isinstance(key_list_val, RESULT_ARG_TYPES['key']) or
-                    isinstance(key_list_val, bool)):
-                raise CloudantArgumentError(134, RESULT_ARG_TYPES['key'])
-    if key == 'stale':
-        if val not in ('ok', 'update_after'):
-            raise CloudantArgumentError(135, val)
+    handler[0](val)
 
 def _py_to_couch_translate(key, val, encoder=None):
     """
@@ -211,17 +200,100 @@ def _py_to_couch_translate(key, val, encoder=None):
     equivalent.
     """
     try:
-        if key in ['keys', 'endkey_docid', 'startkey_docid', 'stale', 'update']:
-            return {key: val}
-        if key in ['endkey', 'key', 'startkey']:
-            return {key: json.dumps(val, cls=encoder)}
-        if val is None:
-            return {key: None}
-        arg_converter = TYPE_CONVERTERS.get(type(val))
-        return {key: arg_converter(val)}
+        return {key: _RESULT_ARG_HANDLERS[key][1](val, encoder)}
     except Exception as ex:
         raise CloudantArgumentError(136, key, ex)
 
+def _validate_keys_arg(val):
+    """
+    Validates the members of a ``keys`` parameter value.
+    """
+    for key_list_val in val:
+        if (not isinstance(key_list_val, RESULT_ARG_TYPES['key']) or
+                isinstance(key_list_val, bool)):
+            raise CloudantArgumentError(134, RESULT_ARG_TYPES['key'])
+
+def _validate_stale_arg(val):
+    """
+    Validates a ``stale`` parameter value.
+    """
+    if val not in ('ok', 'update_after'):
+        raise CloudantArgumentError(135, val)
+
+def _result_arg_validator(key, arg_types):
+    """
+    Returns a function that validates a value of the ``key`` parameter.
+    """
+    # Ensure that a boolean is not passed in if an integer is expected
+    reject_bool = bool not in arg_types and int in arg_types
+    check_value = {'keys': _validate_keys_arg,
+                   'stale': _validate_stale_arg}.get(key)
+
+    def validate(val):
+        # pylint: disable=unidiomatic-typecheck
+        if (not isinstance(val, arg_types) or
+                (reject_bool and type(val) is bool)):
+            raise CloudantArgumentError(117, key, arg_types)
+        if check_value is not None:
+            check_value(val)
+    return validate
+
+# pylint: disable=unused-argument
+def _translate_as_is(val, encoder):
+    """
+    Translates a parameter value that CouchDB/Cloudant takes unchanged.
+    """
+    return val
+
+def _translate_json(val, encoder):
+    """
+    Translates a parameter value that CouchDB/Cloudant takes as JSON.
+    """
+    return json.dumps(val, cls=encoder)
+
+def _translate_bool(val, encoder):
+    """
+    Translates a ``bool`` parameter value.
+    """
+    return 'true' if val else 'false'
+
+def _translate_by_type(val, encoder):
+    """
+    Translates a parameter value according to its type.
+    """
+    # pylint: disable=unidiomatic-typecheck
+    if val is None or type(val) is int:
+        return val
+    arg_converter = TYPE_CONVERTERS.get(type(val))
+    if arg_converter is None:
+        raise TypeError(
+            'Unsupported value type {0}'.format(type(val).__name__))
+    return arg_converter(val)
+# pylint: enable=unused-argument
+
+_AS_IS_RESULT_ARGS = frozenset(
+    ('keys', 'endkey_docid', 'startkey_docid', 'stale', 'update'))
+_JSON_RESULT_ARGS = frozenset(('endkey', 'key', 'startkey'))
+
+def _result_arg_translator(key):
+    """
+    Returns the function that translates a value of the ``key`` parameter.
+    """
+    if key in _AS_IS_RESULT_ARGS:
+        return _translate_as_is
+    if key in _JSON_RESULT_ARGS:
+        return _translate_json
+    if RESULT_ARG_TYPES[key] == (bool,):
+        return _translate_bool
+    return _translate_by_type
+
+# Validator and translator of each result parameter, built once so that each
+# parameter is handled with a single lookup
+_RESULT_ARG_HANDLERS = {
+    key: (_result_arg_validator(key, arg_types), _result_arg_translator(key))
+    for key, arg_types in iteritems_(RESULT_ARG_TYPES)
+}
+
 def type_or_none(typerefs, value):
     """
     Provides a helper function to check that a value is of the types passed or
@@ -394,7 +394,7 @@ class CouchDB(dict):
 
         :returns: Database object
         """
-        if key in list(self.keys()):
+        if super(CouchDB, self).__contains__(key):
             return super(CouchDB, self).__getitem__(key)
         db = self._DATABASE_CLASS(self, key)
         if db.exists():
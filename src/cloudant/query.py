@@ -18,6 +18,7 @@ API module for composing and executing Cloudant queries.
 
 import json
 import contextlib
+from collections import OrderedDict
 
 from ._2to3 import iteritems_
 from .result import QueryResult
@@ -25,6 +26,32 @@ from .error import CloudantArgumentError
 from ._common_util import QUERY_ARG_TYPES
 from ._common_util import response_to_json_dict
 
+_FIND_HEADERS = {'Content-Type': 'application/json'}
+
+def _type_check(arg_types):
+    """
+    Returns a function that checks whether a value is an instance of
+    ``arg_types``.
+    """
+    return lambda val: isinstance(val, arg_types)
+
+# Query argument checks, built once from QUERY_ARG_TYPES when the module is
+# loaded so that validating an argument is a single lookup and call.
+_QUERY_ARG_CHECKS = {
+    key: _type_check(arg_types) for key, arg_types in iteritems_(QUERY_ARG_TYPES)
+}
+
+def _validate_query_args(args):
+    """
+    Validates the Query arguments and values.
+    """
+    for key, val in iteritems_(args):
+        check = _QUERY_ARG_CHECKS.get(key)
+        if check is None:
+            raise CloudantArgumentError(129, key)
+        if not check(val):
+            raise CloudantArgumentError(130, key, QUERY_ARG_TYPES[key])
+
 class Query(dict):
     """
     Encapsulates a query as a dictionary based object, providing a sliceable
@@ -88,14 +115,23 @@ class Query(dict):
         what it believes to be the best index.
     :param str partition_key: Optional. Specify a query partition key. Defaults
         to ``None`` resulting in global queries.
+    :param int page_cache_size: Optional. Number of query responses to keep in
+        memory and return again when an identical request is repeated, for
+        example when the same result page is read more than once.  Cached
+        responses may not reflect subsequent database updates and are shared
+        between callers so must not be modified.  Defaults to ``0`` which
+        disables the cache.
     """
 
     def __init__(self, database, **kwargs):
         super(Query, self).__init__()
         self._database = database
         self._partition_key = kwargs.pop('partition_key', None)
+        self._page_cache_size = kwargs.pop('page_cache_size', 0)
+        self._page_cache = OrderedDict()
         self._r_session = self._database.r_session
         self._encoder = self._database.client.encoder
+        self._url = None
         if kwargs.get('fields', True) is None:
             del kwargs['fields']  # delete `None` fields kwarg
         if kwargs:
@@ -105,17 +141,19 @@ class Query(dict):
     @property
     def url(self):
         """
-        Constructs and returns the Query URL.
+        Constructs and returns the Query URL.  The URL is fixed for the
+        lifetime of the Query so it is only constructed once.
 
         :returns: Query URL
         """
-        if self._partition_key:
-            base_url = self._database.database_partition_url(
-                self._partition_key)
-        else:
-            base_url = self._database.database_url
-
-        return base_url + '/_find'
+        if self._url is None:
+            if self._partition_key:
+                base_url = self._database.database_partition_url(
+                    self._partition_key)
+            else:
+                base_url = self._database.database_url
+            self._url = base_url + '/_find'
+        return self._url
 
     def __call__(self, **kwargs):
         """
@@ -166,23 +204,38 @@ class Query(dict):
         data.update(kwargs)
 
         # Validate query arguments and values
-        for key, val in iteritems_(data):
-            if key not in list(QUERY_ARG_TYPES.keys()):
-                raise CloudantArgumentError(129, key)
-            if not isinstance(val, QUERY_ARG_TYPES[key]):
-                raise CloudantArgumentError(130, key, QUERY_ARG_TYPES[key])
-        if data.get('selector', None) is None or data.get('selector') == {}:
+        _validate_query_args(data)
+        if not data.get('selector'):
             raise CloudantArgumentError(131)
+        body = json.dumps(data, cls=self._encoder)
+
+        if self._page_cache_size:
+            cached = self._page_cache.get(body)
+            if cached is not None:
+                self._page_cache.move_to_end(body)
+                return cached
 
         # Execute query find
-        headers = {'Content-Type': 'application/json'}
         resp = self._r_session.post(
             self.url,
-            headers=headers,
-            data=json.dumps(data, cls=self._encoder)
+            headers=_FIND_HEADERS,
+            data=body
         )
         resp.raise_for_status()
-        return response_to_json_dict(resp)
+        data = response_to_json_dict(resp)
+
+        if self._page_cache_size:
+            self._page_cache[body] = data
+            if len(self._page_cache) > self._page_cache_size:
+                self._page_cache.popitem(last=False)
+        return data
+
+    def cache_clear(self):
+        """
+        Discards any query responses held in the Query page cache.  See the
+        ``page_cache_size`` option of :class:`~cloudant.query.Query`.
+        """
+        self._page_cache.clear()
 
     @contextlib.contextmanager
     def custom_result(self, **options):
@@ -16,20 +16,58 @@
 API module/class for handling database replications
 """
 
-import uuid
+from collections import OrderedDict
+from copy import deepcopy
+from uuid import uuid4
 
-from requests.exceptions import HTTPError
+from requests.exceptions import ChunkedEncodingError, HTTPError
 
+from ._common_util import DESIGN_PREFIX, response_to_json_dict
 from .error import CloudantReplicatorException, CloudantClientException
 from .document import Document
 from .scheduler import Scheduler
 
+# Milliseconds a follow_replication changes request waits for an update
+_FOLLOW_TIMEOUT = 10000
+
+# Replication states after which follow_replication stops
+_TERMINAL_STATES = frozenset(('error', 'failed', 'completed'))
+
+# Number of replication documents kept for conditional requests
+_DOCUMENT_CACHE_SIZE = 32
+
+def _replication_endpoint(database, credentials):
+    """
+    Composes the replication document source or target for a database.  The
+    credentials of each client are looked up once and kept in the
+    ``credentials`` dict for use by further endpoints of the same document.
+    """
+    endpoint = {'url': database.database_url}
+    if database.admin_party:
+        return endpoint  # no credentials required
+    client = database.client
+    client_credentials = credentials.get(id(client))
+    if client_credentials is None:
+        if client.is_iam_authenticated:
+            client_credentials = ('iam', client.r_session.get_api_key)
+        else:
+            client_credentials = ('basic', database.creds['basic_auth'])
+        credentials[id(client)] = client_credentials
+    auth_type, secret = client_credentials
+    if auth_type == 'iam':
+        endpoint['auth'] = {'iam': {'api_key': secret}}
+    else:
+        endpoint['headers'] = {'Authorization': secret}
+    return endpoint
+
 class Replicator(object):
     """
     Provides a database replication API.  A Replicator object is instantiated
     with a reference to a client/session.  It retrieves the ``_replicator``
     database for the specified client and uses that database object to manage
-    replications.
+    replications.  All requests are made through the client session and so
+    share its connection pool, which can be configured with the ``adapter``
+    option of the client.
 
     :param client: Client instance used by the database.  Can either be a
         ``CouchDB`` or ``Cloudant`` client instance.
@@ -42,6 +80,31 @@ class Replicator(object):
             self.database = client[repl_db]
         except Exception:
             raise CloudantClientException(404, repl_db)
+        self._scheduler_supported = None
+        self._scheduler = None
+        self._documents = OrderedDict()
+
+    @property
+    def scheduler(self):
+        """
+        Provides the :class:`~cloudant.scheduler.Scheduler` used to retrieve
+        replication states, created on first use.
+
+        :returns: Scheduler instance for the client
+        """
+        if self._scheduler is None:
+            self._scheduler = Scheduler(self.client)
+        return self._scheduler
+
+    @property
+    def _has_scheduler(self):
+        """
+        Whether the server provides the ``_scheduler`` endpoints, looked up
+        from the client features once and then remembered.
+        """
+        if self._scheduler_supported is None:
+            self._scheduler_supported = "scheduler" in self.client.features()
+        return self._scheduler_supported
 
     def create_replication(self, source_db=None, target_db=None,
                            repl_id=None, **kwargs):
@@ -70,61 +133,52 @@ class Replicator(object):
             raise CloudantReplicatorException(102)
 
         data = dict(
-            _id=repl_id if repl_id else str(uuid.uuid4()),
+            _id=repl_id if repl_id else uuid4().hex,
             **kwargs
         )
 
-        # replication source
+        # replication source and target, looking up the credentials only once
+        # when both databases belong to the same client
 
-        data['source'] = {'url': source_db.database_url}
-        if source_db.admin_party:
-            pass  # no credentials required
-        elif source_db.client.is_iam_authenticated:
-            data['source'].update({'auth': {
-                'iam': {'api_key': source_db.client.r_session.get_api_key}
-            }})
-        else:
-            data['source'].update({'headers': {
-                'Authorization': source_db.creds['basic_auth']
-            }})
-
-        # replication target
-
-        data['target'] = {'url': target_db.database_url}
-        if target_db.admin_party:
-            pass  # no credentials required
-        elif target_db.client.is_iam_authenticated:
-            data['target'].update({'auth': {
-                'iam': {'api_key': target_db.client.r_session.get_api_key}
-            }})
-        else:
-            data['target'].update({'headers': {
-                'Authorization': target_db.creds['basic_auth']
-            }})
+        credentials = {}
+        data['source'] = _replication_endpoint(source_db, credentials)
+        data['target'] = _replication_endpoint(target_db, credentials)
 
         # add user context delegation
 
-        if not data.get('user_ctx') and self.database.creds and \
-            self.database.creds.get('user_ctx'):
-            data['user_ctx'] = self.database.creds['user_ctx']
+        if not data.get('user_ctx'):
+            creds = self.database.creds
+            if creds and creds.get('user_ctx'):
+                data['user_ctx'] = creds['user_ctx']
 
         return self.database.create_document(data, throw_on_exists=True)
 
-    def list_replications(self):
+    def list_replications(self, wrap=True):
         """
         Retrieves all replication documents from the replication database.
 
-        :returns: List containing replication Document objects
+        :param bool wrap: Specifies whether the replication documents are
+            returned as Document objects.  If set to False the documents are
+            returned as plain dictionaries, which is cheaper when they are
+            only read.  Defaults to True.
+
+        :returns: List containing replication Document objects, or
+            dictionaries if ``wrap`` is False
         """
-        docs = self.database.all_docs(include_docs=True)['rows']
-        documents = []
-        for doc in docs:
-            if doc['id'].startswith('_design/'):
-                continue
-            document = Document(self.database, doc['id'])
-            document.update(doc['doc'])
-            documents.append(document)
-        return documents
+        rows = [row for row in self.database.all_docs(include_docs=True)['rows']
+                if not row['id'].startswith(DESIGN_PREFIX)]
+        if not wrap:
+            return [row['doc'] for row in rows]
+        return [self._document_from_row(row) for row in rows]
+
+    def _document_from_row(self, row):
+        """
+        Wraps an ``include_docs`` result row as a replication Document
+        without any further remote requests.
+        """
+        document = Document(self.database)
+        document.update(row['doc'])
+        return document
 
     def replication_state(self, repl_id):
         """
@@ -137,21 +191,51 @@ class Replicator(object):
 
         :returns: Replication state as a ``str``
         """
-        if "scheduler" in self.client.features():
+        if self._has_scheduler:
             try:
-                repl_doc = Scheduler(self.client).get_doc(repl_id)
+                repl_doc = self.scheduler.get_doc(repl_id)
             except HTTPError as err:
                 raise CloudantReplicatorException(err.response.status_code, repl_id)
             state = repl_doc['state']
         else:
-            try:
-                repl_doc = self.database[repl_id]
-            except KeyError:
+            repl_doc = self._fetch_document(repl_id)
+            if repl_doc is None:
                 raise CloudantReplicatorException(404, repl_id)
-            repl_doc.fetch()
             state = repl_doc.get('_replication_state')
         return state
 
+    def _fetch_document(self, repl_id):
+        """
+        Retrieves the current content of a replication document with a
+        single request.  The request is made conditional on the ETag of the
+        last content retrieved for the same document so that an unchanged
+        document is not transferred and decoded again.  The content of the
+        most recently retrieved documents is kept for this purpose.
+
+        :returns: Replication Document, or ``None`` if it does not exist
+        """
+        repl_doc = Document(self.database, repl_id)
+        etag, content = self._documents.get(repl_id, (None, None))
+        headers = {'If-None-Match': etag} if etag else None
+        resp = repl_doc.r_session.get(repl_doc.document_url, headers=headers)
+        if resp.status_code == 304:
+            self._documents.move_to_end(repl_id)
+            repl_doc.update(deepcopy(content))
+            return repl_doc
+        if resp.status_code == 404:
+            self._documents.pop(repl_id, None)
+            return None
+        resp.raise_for_status()
+        content = response_to_json_dict(resp, cls=repl_doc.decoder)
+        etag = resp.headers.get('ETag')
+        if etag:
+            self._documents[repl_id] = (etag, deepcopy(content))
+            self._documents.move_to_end(repl_id)
+            if len(self._documents) > _DOCUMENT_CACHE_SIZE:
+                self._documents.popitem(last=False)
+        repl_doc.update(content)
+        return repl_doc
+
     def follow_replication(self, repl_id):
         """
         Blocks and streams status of a given replication.
@@ -169,47 +253,89 @@ class Replicator(object):
         :returns: Iterable stream of copies of the replication Document
             and replication state as a ``str`` for the specified replication id
         """
-        def update_state():
-            """
-            Retrieves the replication state.
-            """
-            if "scheduler" in self.client.features():
-                try:
-                    arepl_doc = Scheduler(self.client).get_doc(repl_id)
-                    return arepl_doc, arepl_doc['state']
-                except HTTPError:
-                    return None, None
-            else:
-                try:
-                    arepl_doc = self.database[repl_id]
-                    arepl_doc.fetch()
-                    return arepl_doc, arepl_doc.get('_replication_state')
-                except KeyError:
-                    return None, None
-
+        # Make sure we fetch the state up front, just in case it moves
+        # too fast and we miss it in the changes feed.
+        repl_doc, state = self._update_state(repl_id)
+        if repl_doc:
+            yield repl_doc
+        # This is a little awkward, since 2.1 the terminal states are
+        # "failed" and "completed", so those should be the exit states, but
+        # for backwards compatibility with older versions "error" is also
+        # needed. The code has always exited for "error" state even long
+        # after 2.1 was available so that behaviour is retained.
+        if state in _TERMINAL_STATES:
+            return
+
+        # Now poll the changes feed of the replication document.  Each
+        # longpoll request returns as soon as the document has changed since
+        # the last sequence seen, and at the latest after a short timeout, so
+        # the state is picked up as soon as it is written and no request is
+        # left waiting once it is terminal.  The changes embed the updated
+        # document so that no further request is needed to read its state.
+        # The scheduler also moves replications between states without
+        # changing the document, so with the scheduler its state is checked
+        # again after each request that returns no change.
+        since = 0
         while True:
-            # Make sure we fetch the state up front, just in case it moves
-            # too fast and we miss it in the changes feed.
-            repl_doc, state = update_state()
-            if repl_doc:
-                yield repl_doc
-            # This is a little awkward, since 2.1 the terminal states are
-            # "failed" and "completed", so those should be the exit states, but
-            # for backwards compatibility with older versions "error" is also
-            # needed. The code has always exited for "error" state even long
-            # after 2.1 was available so that behaviour is retained.
-            if state is not None and state in ['error', 'failed', 'completed']:
-                return
-
-            # Now listen on changes feed for the state
-            for change in self.database.changes():
-                if change.get('id') == repl_id:
-                    repl_doc, state = update_state()
+            changes = self.database.changes(
+                feed='longpoll',
+                since=since,
+                timeout=_FOLLOW_TIMEOUT,
+                filter='_doc_ids',
+                doc_ids=[repl_id],
+                include_docs=True
+            )
+            changed = False
+            try:
+                for change in changes:
+                    since = change.get('seq', since)
+                    if change.get('id') != repl_id:
+                        continue
+                    changed = True
+                    if self._has_scheduler or 'doc' not in change:
+                        # The scheduler, not the document, holds the state, or
+                        # the change came without the document embedded
+                        repl_doc, state = self._update_state(repl_id)
+                    elif change.get('deleted'):
+                        repl_doc, state = None, None
+                    else:
+                        repl_doc = self._document_from_row(change)
+                        state = repl_doc.get('_replication_state')
                     if repl_doc is not None:
                         yield repl_doc
                     # See note about these states
-                    if state is not None and state in ['error', 'failed', 'completed']:
+                    if state in _TERMINAL_STATES:
                         return
+            except ChunkedEncodingError:
+                # The response was cut short, resume after the last change seen
+                continue
+            since = changes.last_seq or since
+            if not changed and self._has_scheduler:
+                last_state = state
+                repl_doc, state = self._update_state(repl_id)
+                if repl_doc is not None and state != last_state:
+                    yield repl_doc
+                if state in _TERMINAL_STATES:
+                    return
+
+    def _update_state(self, repl_id):
+        """
+        Retrieves the replication document and state for
+        :func:`~cloudant.replicator.Replicator.follow_replication`.
+
+        :returns: Tuple of the replication document and state, or
+            ``(None, None)`` if the replication document does not exist
+        """
+        if self._has_scheduler:
+            try:
+                repl_doc = self.scheduler.get_doc(repl_id)
+                return repl_doc, repl_doc['state']
+            except HTTPError:
+                return None, None
+        repl_doc = self._fetch_document(repl_id)
+        if repl_doc is None:
+            return None, None
+        return repl_doc, repl_doc.get('_replication_state')
 
     def stop_replication(self, repl_id):
         """
@@ -223,10 +349,9 @@ class Replicator(object):
             stop.
         """
 
-        try:
-            repl_doc = self.database[repl_id]
-        except KeyError:
+        repl_doc = self._fetch_document(repl_id)
+        if repl_doc is None:
             raise CloudantReplicatorException(404, repl_id)
 
-        repl_doc.fetch()
         repl_doc.delete()
+        self._documents.pop(repl_id, None)
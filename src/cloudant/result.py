@@ -15,12 +15,19 @@
 """
 API module for interacting with result collections.
 """
-from collections import deque
+from collections import OrderedDict, deque
 from functools import partial
-from ._2to3 import STRTYPE
+from ._2to3 import STRTYPE, iteritems_
 from .error import ResultException
 from ._common_util import py_to_couch_validate, type_or_none
 
+# Options that cannot be combined with key access or key slicing, and with
+# iteration.  The tuples are reported in the error messages.
+_KEY_ACCESS_INVALID_OPTIONS_ARG = ('key', 'keys', 'startkey', 'endkey')
+_KEY_ACCESS_INVALID_OPTIONS = frozenset(_KEY_ACCESS_INVALID_OPTIONS_ARG)
+_ITERATION_INVALID_OPTIONS_ARG = ('limit', )
+_ITERATION_INVALID_OPTIONS = frozenset(_ITERATION_INVALID_OPTIONS_ARG)
+
 class ResultByKey(object):
     """
     Provides a wrapper for a value used to retrieve records from a result
@@ -36,13 +43,40 @@ class ResultByKey(object):
         # as opposed to:
         result[9]                # gets the 10th record of the result collection
 
-        :param value: A value representing a Result key.
+        :param value: A value representing a Result key.  Available as the
+            ``value`` attribute.
     """
     def __init__(self, value):
-        self._value = value
+        self.value = value
 
     def __call__(self):
-        return self._value
+        """
+        Returns the key value, same as the ``value`` attribute.
+        """
+        return self.value
+
+# Argument types interpreted as a key by Result key access and key slicing
+_SIMPLE_KEY_TYPES = (STRTYPE, list)
+_KEY_TYPES = (STRTYPE, list, ResultByKey)
+
+def _index_or_none(value):
+    """
+    Checks that a value is an integer index, which a ``bool`` is not, or None.
+    """
+    return value is None or (isinstance(value, int) and
+                             not isinstance(value, bool))
+
+def _cache_key(arg):
+    """
+    Returns a hashable key identifying a Result key access or slicing
+    argument.
+    """
+    if isinstance(arg, slice):
+        return (slice, _cache_key(arg.start), _cache_key(arg.stop),
+                _cache_key(arg.step))
+    if isinstance(arg, ResultByKey):
+        return (ResultByKey, repr(arg.value))
+    return (type(arg), repr(arg))
 
 class Result(object):
     """
@@ -130,6 +164,12 @@ class Result(object):
 
     :param str method_ref: A reference to the method or callable that returns
         the JSON content result to be wrapped as a Result.
+    :param int cache_size: Optional. Number of key access and slicing results
+        to keep in memory and return again when the same key or slice is
+        requested with the same options.  Cached rows may not reflect
+        subsequent database updates and are shared between callers so must
+        not be modified.  Retrieving the entire result with ``[:]`` is never
+        cached.  Defaults to ``0`` which disables the cache.
     :param bool descending: Return documents in descending key order.
     :param endkey: Stop returning records at this specified key.
         Not valid when used with key access and key slicing.
@@ -171,10 +211,28 @@ class Result(object):
         waiting for an update, but update them immediately after the request.
 
     """
+    # Key access and index handlers by exact argument type, so that the common
+    # arguments are dispatched with a single lookup
+    _ARG_HANDLERS = {
+        int: '_handle_result_by_index',
+        str: '_handle_result_by_key',
+        list: '_handle_result_by_key',
+        ResultByKey: '_handle_result_by_result_key'
+    }
+
     def __init__(self, method_ref, **options):
         self.options = options
         self._ref = method_ref
         self._page_size = options.pop('page_size', 100)
+        # The page size is only used, and so an invalid page size only
+        # reported, when iterating but it is checked once here.
+        try:
+            self._page_size = int(self._page_size)
+            self._valid_page_size = self._page_size > 0
+        except (TypeError, ValueError):
+            self._valid_page_size = False
+        self._cache_size = options.pop('cache_size', 0)
+        self._cache = OrderedDict()
 
     def __getitem__(self, arg):
         """
@@ -210,40 +268,99 @@ class Result(object):
 
         :returns: Rows data as a list in JSON format
         """
+        if isinstance(arg, slice) and arg.start is None and arg.stop is None:
+            # slice is entire result set - no additional processing required
+            return self._parse_data(self._ref(**self.options))
+        if not self._cache_size:
+            return self._get_rows(arg)
+
+        cache_key = (self._cache_scope(), _cache_key(arg))
+        rows = self._cache.get(cache_key)
+        if rows is not None:
+            self._cache.move_to_end(cache_key)
+            return rows
+        rows = self._get_rows(arg)
+        self._cache[cache_key] = rows
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return rows
+
+    def cache_clear(self):
+        """
+        Discards any rows held in the Result cache.  See the ``cache_size``
+        option of :class:`~cloudant.result.Result`.
+        """
+        self._cache.clear()
+
+    def _cache_scope(self):
+        """
+        Returns a key identifying the request definition that cached rows were
+        retrieved with.
+        """
+        return repr(self.options)
+
+    def _get_rows(self, arg):
+        """
+        Retrieves the rows for a key access or slicing argument other than
+        the entire result set slice.
+        """
         data = None
-        if isinstance(arg, int):
-            data = self._handle_result_by_index(arg)
-        elif isinstance(arg, (STRTYPE, list)):
-            data = self._handle_result_by_key(arg)
-        elif isinstance(arg, ResultByKey):
-            data = self._handle_result_by_key(arg())
+        handler = self._ARG_HANDLERS.get(type(arg))
+        if handler is not None:
+            data = getattr(self, handler)(arg)
         elif isinstance(arg, slice):
-            # slice is entire result set - no additional processing required
-            if arg.start is None and arg.stop is None:
-                data = self._ref(**self.options)
             # key slice identified
-            elif (type_or_none((STRTYPE, list, ResultByKey), arg.start) and
-                  type_or_none((STRTYPE, list, ResultByKey), arg.stop)):
+            if (type_or_none(_KEY_TYPES, arg.start) and
+                  type_or_none(_KEY_TYPES, arg.stop)):
                 data = self._handle_result_by_key_slice(arg)
             # index slice identified
-            elif (type_or_none(int, arg.start) and
-                  type_or_none(int, arg.stop)):
+            elif _index_or_none(arg.start) and _index_or_none(arg.stop):
                 data = self._handle_result_by_idx_slice(arg)
+        # subclasses of the argument types, except bool
+        elif isinstance(arg, int) and not isinstance(arg, bool):
+            data = self._handle_result_by_index(arg)
+        elif isinstance(arg, _SIMPLE_KEY_TYPES):
+            data = self._handle_result_by_key(arg)
+        elif isinstance(arg, ResultByKey):
+            data = self._handle_result_by_result_key(arg)
         if data is None:
             raise ResultException(101, arg)
         return self._parse_data(data)
 
+    def _reject_options(self, code, invalid_options_arg, invalid_options):
+        """
+        Raises a ResultException with the given code if any of the invalid
+        options are set.
+        """
+        if not invalid_options.isdisjoint(self.options):
+            raise ResultException(code, invalid_options_arg, self.options)
+
+    def _split_skip_limit(self):
+        """
+        Separates the ``skip`` and ``limit`` options from the other options
+        for index access and index slicing.  The options are only copied when
+        they contain ``skip`` or ``limit``.
+
+        :returns: Tuple of the validated skip and limit values and the
+            remaining options
+        """
+        opts = self.options
+        skip = opts.get('skip', 0)
+        limit = opts.get('limit')
+        py_to_couch_validate('skip', skip)
+        py_to_couch_validate('limit', limit)
+        if 'skip' in opts or 'limit' in opts:
+            opts = {key: val for key, val in iteritems_(opts)
+                    if key not in ('skip', 'limit')}
+        return skip, limit, opts
+
     def _handle_result_by_index(self, idx):
         """
         Handle processing when the result argument provided is an integer.
         """
         if idx < 0:
             return None
-        opts = dict(self.options)
-        skip = opts.pop('skip', 0)
-        limit = opts.pop('limit', None)
-        py_to_couch_validate('skip', skip)
-        py_to_couch_validate('limit', limit)
+        skip, limit, opts = self._split_skip_limit()
         if limit is not None and idx >= limit:
             # Result is out of range
             return dict()
@@ -253,78 +370,73 @@ class Result(object):
         """
         Handle processing when the result argument provided is a document key.
         """
-        invalid_options = ('key', 'keys', 'startkey', 'endkey')
-        if any(x in invalid_options for x in self.options):
-            raise ResultException(102, invalid_options, self.options)
+        self._reject_options(102, _KEY_ACCESS_INVALID_OPTIONS_ARG,
+                             _KEY_ACCESS_INVALID_OPTIONS)
         return self._ref(key=key, **self.options)
 
+    def _handle_result_by_result_key(self, result_key):
+        """
+        Handle processing when the result argument provided is a
+        :class:`~cloudant.result.ResultByKey`.
+        """
+        return self._handle_result_by_key(result_key.value)
+
     def _handle_result_by_idx_slice(self, idx_slice):
         """
         Handle processing when the result argument provided is an index slice.
         """
-        opts = dict(self.options)
-        skip = opts.pop('skip', 0)
-        limit = opts.pop('limit', None)
-        py_to_couch_validate('skip', skip)
-        py_to_couch_validate('limit', limit)
+        skip, limit, opts = self._split_skip_limit()
         start = idx_slice.start
         stop = idx_slice.stop
-        data = None
-        # start and stop cannot be None and both must be greater than 0
-        if all(i is not None and i >= 0 for i in [start, stop]) and start < stop:
-            if limit is not None:
-                if start >= limit:
-                    # Result is out of range
-                    return dict()
-                if stop > limit:
-                    # Ensure that slice does not extend past original limit
-                    return self._ref(skip=skip+start, limit=limit-start, **opts)
-            data = self._ref(skip=skip+start, limit=stop-start, **opts)
-        elif start is not None and stop is None and start >= 0:
-            if limit is not None:
-                if start >= limit:
-                    # Result is out of range
-                    return dict()
-                # Ensure that slice does not extend past original limit
-                data = self._ref(skip=skip+start, limit=limit-start, **opts)
-            else:
-                data = self._ref(skip=skip+start, **opts)
-        elif start is None and stop is not None and stop >= 0:
+        if start is None:
+            # stop must be greater than or equal to 0
+            if stop < 0:
+                return None
+            # Ensure that slice does not extend past original limit
             if limit is not None and stop > limit:
-                # Ensure that slice does not extend past original limit
-                data = self._ref(skip=skip, limit=limit, **opts)
-            else:
-                data = self._ref(skip=skip, limit=stop, **opts)
-        return data
+                stop = limit
+            return self._ref(skip=skip, limit=stop, **opts)
+        # start must be greater than or equal to 0 and less than stop
+        if start < 0 or (stop is not None and stop <= start):
+            return None
+        if limit is not None:
+            if start >= limit:
+                # Result is out of range
+                return dict()
+            # Ensure that slice does not extend past original limit
+            if stop is None or stop > limit:
+                stop = limit
+        if stop is None:
+            return self._ref(skip=skip+start, **opts)
+        return self._ref(skip=skip+start, limit=stop-start, **opts)
 
     def _handle_result_by_key_slice(self, key_slice):
         """
         Handle processing when the result argument provided is a key slice.
         """
-        invalid_options = ('key', 'keys', 'startkey', 'endkey')
-        if any(x in invalid_options for x in self.options):
-            raise ResultException(102, invalid_options, self.options)
+        self._reject_options(102, _KEY_ACCESS_INVALID_OPTIONS_ARG,
+                             _KEY_ACCESS_INVALID_OPTIONS)
 
         if isinstance(key_slice.start, ResultByKey):
-            start = key_slice.start()
+            start = key_slice.start.value
         else:
             start = key_slice.start
 
         if isinstance(key_slice.stop, ResultByKey):
-            stop = key_slice.stop()
+            stop = key_slice.stop.value
         else:
             stop = key_slice.stop
 
-        if (start is not None and stop is not None and
-                isinstance(start, type(stop))):
-            data = self._ref(startkey=start, endkey=stop, **self.options)
-        elif start is not None and stop is None:
-            data = self._ref(startkey=start, **self.options)
-        elif start is None and stop is not None:
-            data = self._ref(endkey=stop, **self.options)
-        else:
-            data = None
-        return data
+        key_range = {}
+        if start is not None:
+            key_range['startkey'] = start
+        if stop is not None:
+            if start is not None and not isinstance(start, type(stop)):
+                return None
+            key_range['endkey'] = stop
+        if not key_range:
+            return None
+        return self._ref(**key_range, **self.options)
 
     def __iter__(self):
         """
@@ -338,25 +450,24 @@ class Result(object):
 
         :returns: Iterable data sequence
         """
-        invalid_options = ('limit', )
-        if any(x in invalid_options for x in self.options):
-            raise ResultException(103, invalid_options, self.options)
+        self._reject_options(103, _ITERATION_INVALID_OPTIONS_ARG,
+                             _ITERATION_INVALID_OPTIONS)
 
-        try:
-            self._page_size = int(self._page_size)
-            if self._page_size <= 0:
-                raise ResultException(104, self._page_size)
-        except ValueError:
+        if not self._valid_page_size:
             raise ResultException(104, self._page_size)
 
+        # skip and startkey only apply to the first page, later pages start
+        # from the last row seen.  The options are copied so that the result
+        # can be iterated again from the same starting point.
+        opts = dict(self.options)
         init_opts = {
-            'skip': self.options.pop('skip', None),
-            'startkey': self.options.pop('startkey', None)
+            'skip': opts.pop('skip', None),
+            'startkey': opts.pop('startkey', None)
         }
 
         self._call = partial(self._ref,  #pylint: disable=attribute-defined-outside-init
                              limit=self._real_page_size,
-                             **self.options)
+                             **opts)
 
         response = self._call(**{k: v
                                  for k, v
@@ -377,43 +488,46 @@ class Result(object):
         '''
         Iterate through view data.
         '''
-
+        parse_data = self._parse_data
+        real_page_size = self._real_page_size
         while True:
-            result = deque(self._parse_data(response))
+            result = deque(parse_data(response))
             del response
-            if result:
-                doc_count = len(result)
-                last = result.pop()
-                while result:
-                    yield result.popleft()
-
-                # We expect doc_count = self._page_size + 1 results, if
-                # we have self._page_size or less it means we are on the
-                # last page and need to return the last result.
-                if doc_count < self._real_page_size:
-                    yield last
-                    break
-                del result
-
-                # if we are in a view, keys could be duplicate so we
-                # need to start from the right docid
-                last_doc_id = last.get('id')
-                if last_doc_id is not None:
-                    response = self._call(startkey=last['key'],
-                                          startkey_docid=last_doc_id)
-                # reduce result keys are unique by definition
-                else:
-                    response = self._call(startkey=last['key'])
+            if not result:
+                break
 
-            else:
+            doc_count = len(result)
+            last = result.pop()
+            while result:
+                yield result.popleft()
+
+            # We expect doc_count = self._page_size + 1 results, if
+            # we have self._page_size or less it means we are on the
+            # last page and need to return the last result.
+            if doc_count < real_page_size:
+                yield last
                 break
 
+            # if we are in a view, keys could be duplicate so we
+            # need to start from the right docid
+            last_doc_id = last.get('id')
+            if last_doc_id is not None:
+                response = self._call(startkey=last['key'],
+                                      startkey_docid=last_doc_id)
+            # reduce result keys are unique by definition
+            else:
+                response = self._call(startkey=last['key'])
+
     # pylint: disable=no-self-use
     def _parse_data(self, data):
         """
-        Used to extract the rows content from the JSON result content
+        Used to extract the rows content from the JSON result content.  A new
+        empty list is only created when the content has no rows.
         """
-        return data.get('rows', [])
+        try:
+            return data['rows']
+        except KeyError:
+            return []
 
     def all(self):
         """
@@ -427,6 +541,30 @@ class Result(object):
         """
         return self[:]
 
+    def docs(self):
+        """
+        Iterates over the documents of the result collection.  The documents
+        are retrieved along with each page of rows using the ``include_docs``
+        option, so that no further request is needed per document.
+
+        For example:
+
+        .. code-block:: python
+
+            result = Result(database.all_docs, page_size=1000)
+            for doc in result.docs():
+                print doc
+
+        :returns: Iterable document sequence
+        """
+        result = self
+        if not self.options.get('include_docs'):
+            result = Result(self._ref,
+                            page_size=self._page_size,
+                            **dict(self.options, include_docs=True))
+        for row in result:
+            yield row.get('doc')
+
 class QueryResult(Result):
     """
     Provides a index key accessible, sliceable and iterable interface to query
@@ -490,6 +628,9 @@ class QueryResult(Result):
         the JSON content result to be wrapped.
     :param str bookmark: A string that enables you to specify which page of
         results you require.
+    :param int cache_size: Optional. Number of index access and slicing
+        results to keep in memory and return again for repeated requests.
+        Defaults to ``0`` which disables the cache.
     :param list fields: A list of fields to be returned by the query.
     :param int page_size: Sets the page size for result iteration.  Default
         is 100.
@@ -510,10 +651,9 @@ class QueryResult(Result):
     """
     def __init__(self, query, **options):
         # Move skip/limit to options so super class Result can handle as needed.
-        if 'skip' in query and 'skip' not in options:
-            options['skip'] = query['skip']
-        if 'limit' in query and 'limit' not in options:
-            options['limit'] = query['limit']
+        for key in ('skip', 'limit'):
+            if key in query:
+                options.setdefault(key, query[key])
         super(QueryResult, self).__init__(query, **options)
 
     def __getitem__(self, arg):
@@ -538,20 +678,40 @@ class QueryResult(Result):
         :returns: Document data as a list in JSON format
         """
         # Argument can only be an integer or an integer slice.
-        if ((isinstance(arg, int)) or
+        if ((isinstance(arg, int) and not isinstance(arg, bool)) or
                 (isinstance(arg, slice) and
-                 type_or_none(int, arg.start) and
-                 type_or_none(int, arg.stop))):
+                 _index_or_none(arg.start) and
+                 _index_or_none(arg.stop))):
             return super(QueryResult, self).__getitem__(arg)
 
         raise ResultException(101, arg)
 
+    def _cache_scope(self):
+        """
+        Overrides Result._cache_scope to also identify the current content of
+        the query definition, which can be modified after the QueryResult is
+        constructed.
+        """
+        return repr((self.options, self._ref))
+
+    def docs(self):
+        """
+        Overrides Result.docs to iterate over the query result, the rows of
+        which are already the documents.
+
+        :returns: Iterable document sequence
+        """
+        return iter(self)
+
     def _parse_data(self, data):
         """
         Overrides Result._parse_data to extract the docs content from the
         query result JSON response content
         """
-        return data.get('docs', [])
+        try:
+            return data['docs']
+        except KeyError:
+            return []
 
     @property
     def _real_page_size(self):
@@ -564,20 +724,19 @@ class QueryResult(Result):
         '''
         Iterate through query data.
         '''
-
+        parse_data = self._parse_data
+        page_size = self._page_size
         while True:
-            result = self._parse_data(response)
+            result = parse_data(response)
             bookmark = response.get('bookmark')
-            if result:
-                for row in result:
-                    yield row
-
-                del result
-
-                if not bookmark:
-                    break
+            if not result:
+                break
 
-                response = self._call(bookmark=bookmark)
+            yield from result
 
-            else:
+            # A page with fewer documents than the page size is the last
+            # one, there is no need to request the empty page after it.
+            if not bookmark or len(result) < page_size:
                 break
+
+            response = self._call(bookmark=bookmark)
@@ -18,6 +18,17 @@ API module for interacting with scheduler endpoints
 
 from ._common_util import response_to_json_dict
 
+def _paging_params(limit, skip):
+    """
+    Composes the query parameters of a paged scheduler request.
+    """
+    params = dict()
+    if limit is not None:
+        params["limit"] = limit
+    if skip is not None:
+        params["skip"] = skip
+    return params
+
 class Scheduler(object):
     """
     API for retrieving scheduler jobs and documents.
@@ -30,6 +41,9 @@ class Scheduler(object):
         self._client = client
         self._r_session = client.r_session
         self._scheduler = '/'.join([self._client.server_url, '_scheduler'])
+        self._docs_url = '/'.join([self._scheduler, 'docs'])
+        self._replicator_docs_url = '/'.join([self._docs_url, '_replicator'])
+        self._jobs_url = '/'.join([self._scheduler, 'jobs'])
 
     def list_docs(self, limit=None, skip=None):
         """
@@ -42,12 +56,8 @@ class Scheduler(object):
         :param limit: How many results to return.
         :param skip: How many result to skip starting at the beginning, if ordered by document ID.
         """
-        params = dict()
-        if limit is not None:
-            params["limit"] = limit
-        if skip is not None:
-            params["skip"] = skip
-        resp = self._r_session.get('/'.join([self._scheduler, 'docs']), params=params)
+        resp = self._r_session.get(self._docs_url,
+                                   params=_paging_params(limit, skip))
         resp.raise_for_status()
         return response_to_json_dict(resp)
 
@@ -55,7 +65,7 @@ class Scheduler(object):
         """
         Get replication document state for a given replication document ID.
         """
-        resp = self._r_session.get('/'.join([self._scheduler, 'docs', '_replicator', doc_id]))
+        resp = self._r_session.get('/'.join([self._replicator_docs_url, doc_id]))
         resp.raise_for_status()
         return response_to_json_dict(resp)
 
@@ -73,11 +83,7 @@ class Scheduler(object):
         :param limit: How many results to return.
         :param skip: How many result to skip starting at the beginning, if ordered by document ID.
         """
-        params = dict()
-        if limit is not None:
-            params["limit"] = limit
-        if skip is not None:
-            params["skip"] = skip
-        resp = self._r_session.get('/'.join([self._scheduler, 'jobs']), params=params)
+        resp = self._r_session.get(self._jobs_url,
+                                   params=_paging_params(limit, skip))
         resp.raise_for_status()
         return response_to_json_dict(resp)
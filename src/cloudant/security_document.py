@@ -59,6 +59,7 @@ class SecurityDocument(dict):
         self._database_host = self._client.server_url
         self._database_name = database.database_name
         self.encoder = self._client.encoder
+        self._remote_body = None
 
     @property
     def document_url(self):
@@ -103,18 +104,26 @@ class SecurityDocument(dict):
         resp.raise_for_status()
         self.clear()
         self.update(response_to_json_dict(resp))
+        self._remote_body = self.json()
 
     def save(self):
         """
         Saves changes made to the locally cached SecurityDocument object's data
         structures to the remote database.
         """
+        self._put(self.json())
+
+    def _put(self, body):
+        """
+        Writes an encoded security document to the remote database.
+        """
         resp = self.r_session.put(
             self.document_url,
-            data=self.json(),
+            data=body,
             headers={'Content-Type': 'application/json'}
         )
         resp.raise_for_status()
+        self._remote_body = body
 
     def __enter__(self):
         """
@@ -129,6 +138,9 @@ class SecurityDocument(dict):
         """
         Support context like editing of security document fields.
         Handles context exit logic.  Executes a
-        :func:`~cloudant.security_document.SecurityDocument.save` upon exit.
+        :func:`~cloudant.security_document.SecurityDocument.save` upon exit,
+        unless the security document is unchanged since it was fetched.
         """
-        self.save()
+        body = self.json()
+        if body != self._remote_body:
+            self._put(body)
@@ -396,5 +396,18 @@ class PythonToCouchTests(unittest.TestCase):
             python_to_couch({'startkey_docid': 10})
         self.assertTrue(str(cm.exception).startswith(msg))
 
+    def test_unsupported_skip_type(self):
+        """
+        Test skip translation fails with a descriptive message when the value
+        is of an int subclass that cannot be converted.
+        """
+        class SubInt(int):
+            pass
+
+        msg = 'Error converting argument skip: Unsupported value type SubInt'
+        with self.assertRaises(CloudantArgumentError) as cm:
+            python_to_couch({'skip': SubInt(10)})
+        self.assertEqual(str(cm.exception), msg)
+
 if __name__ == '__main__':
     unittest.main()
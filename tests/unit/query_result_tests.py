@@ -208,6 +208,20 @@ class QueryResultTests(UnitTestDbBase):
             invalid_result = result[-1]
         self.assertEqual(cm.exception.status_code, 101)
 
+    def test_get_item_by_bool(self):
+        """
+        Test retrieving a result raises an exception when using a bool as an
+        index or as index slice values.
+        """
+        result = self.create_result()
+        with self.assertRaises(ResultException) as cm:
+            invalid_result = result[True]
+        self.assertEqual(cm.exception.status_code, 101)
+
+        with self.assertRaises(ResultException) as cm:
+            invalid_result = result[False: 10]
+        self.assertEqual(cm.exception.status_code, 101)
+
     def test_get_item_slice_no_start_no_stop(self):
         """
         Test that by not providing a start and a stop slice value, the entire
@@ -219,6 +233,22 @@ class QueryResultTests(UnitTestDbBase):
                     {'_id': 'julia002', 'name': 'julia', 'age': 2}]
         self.assertEqual(result[:], expected)
 
+    def test_get_item_with_cache_after_query_modification(self):
+        """
+        Test that cached rows are not returned after the query definition has
+        been modified.
+        """
+        query = Query(self.db, selector={'_id': {'$lte': 'julia002'}},
+                      fields=['_id'])
+        result = QueryResult(query, cache_size=2)
+        rows = result[0:2]
+        self.assertEqual(rows, [{'_id': 'julia000'}, {'_id': 'julia001'}])
+        self.assertIs(result[0:2], rows)
+        query['selector'] = {'_id': {'$gte': 'julia010'}}
+        self.assertEqual(result[0:2], [{'_id': 'julia010'}, {'_id': 'julia011'}])
+        query['selector']['_id']['$gte'] = 'julia020'
+        self.assertEqual(result[0:2], [{'_id': 'julia020'}, {'_id': 'julia021'}])
+
     def test_get_item_invalid_index_slice(self):
         """
         Test that when invalid start and stop values are provided in a slice
@@ -20,6 +20,7 @@ module docstring.
 
 """
 
+import copy
 import os
 import unittest
 
@@ -167,6 +168,101 @@ class QueryTests(UnitTestDbBase):
             [{'_id': 'julia039'}, {'_id': 'julia038'}, {'_id': 'julia037'}]
         )
 
+    def test_callable_after_query_modification(self):
+        """
+        Test Query __call__ uses the current definition after the Query
+        has been modified between calls
+        """
+        self.populate_db_with_documents(100)
+        query = Query(
+            self.db,
+            selector={'_id': {'$lt': 'julia050'}},
+            fields=['_id'],
+            r=1
+        )
+        resp = query(sort=[{'_id': 'desc'}], limit=1)
+        self.assertEqual(resp['docs'], [{'_id': 'julia049'}])
+        query['selector'] = {'_id': {'$lt': 'julia040'}}
+        resp = query(sort=[{'_id': 'desc'}], limit=1)
+        self.assertEqual(resp['docs'], [{'_id': 'julia039'}])
+
+    def test_callable_after_nested_query_modification(self):
+        """
+        Test Query __call__ uses the current definition after nested values of
+        the Query have been modified between calls
+        """
+        self.populate_db_with_documents(100)
+        query = Query(
+            self.db,
+            selector={'_id': {'$lt': 'julia050'}},
+            fields=['_id'],
+            r=1
+        )
+        resp = query(sort=[{'_id': 'desc'}], limit=1)
+        self.assertEqual(resp['docs'], [{'_id': 'julia049'}])
+        query['selector']['_id']['$lt'] = 'julia040'
+        query['fields'].append('age')
+        resp = query(sort=[{'_id': 'desc'}], limit=1)
+        self.assertEqual(resp['docs'], [{'_id': 'julia039', 'age': 39}])
+
+    def test_callable_after_query_update(self):
+        """
+        Test Query __call__ uses the current definition after the Query has
+        been modified with update
+        """
+        self.populate_db_with_documents(100)
+        query = Query(
+            self.db,
+            selector={'_id': {'$lt': 'julia050'}},
+            fields=['_id'],
+            r=1
+        )
+        resp = query(sort=[{'_id': 'desc'}], limit=1)
+        self.assertEqual(resp['docs'], [{'_id': 'julia049'}])
+        query.update({'selector': {'_id': {'$lt': 'julia040'}}})
+        resp = query(sort=[{'_id': 'desc'}], limit=1)
+        self.assertEqual(resp['docs'], [{'_id': 'julia039'}])
+
+    def test_callable_with_copied_query(self):
+        """
+        Test a copied Query and the original Query are each executed using
+        their own definition
+        """
+        self.populate_db_with_documents(100)
+        query = Query(
+            self.db,
+            selector={'_id': {'$lt': 'julia050'}},
+            fields=['_id'],
+            r=1
+        )
+        resp = query(sort=[{'_id': 'desc'}], limit=1)
+        self.assertEqual(resp['docs'], [{'_id': 'julia049'}])
+        query_copy = copy.copy(query)
+        query_copy['selector'] = {'_id': {'$lt': 'julia040'}}
+        resp = query_copy(sort=[{'_id': 'desc'}], limit=1)
+        self.assertEqual(resp['docs'], [{'_id': 'julia039'}])
+        resp = query(sort=[{'_id': 'desc'}], limit=1)
+        self.assertEqual(resp['docs'], [{'_id': 'julia049'}])
+
+    def test_callable_with_page_cache(self):
+        """
+        Test Query __call__ returns cached responses for repeated requests
+        when a page cache is configured
+        """
+        self.populate_db_with_documents(100)
+        query = Query(
+            self.db,
+            selector={'_id': {'$lt': 'julia050'}},
+            fields=['_id'],
+            page_cache_size=1
+        )
+        resp = query(sort=[{'_id': 'desc'}], limit=1)
+        self.assertEqual(resp['docs'], [{'_id': 'julia049'}])
+        self.assertIs(query(sort=[{'_id': 'desc'}], limit=1), resp)
+        self.assertNotIn('page_cache_size', query)
+        query.cache_clear()
+        self.assertIsNot(query(sort=[{'_id': 'desc'}], limit=1), resp)
+
     def test_custom_result_context_manager(self):
         """
         Test that custom_result yields a context manager and returns expected
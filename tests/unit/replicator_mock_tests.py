@@ -19,11 +19,16 @@ _replicator_mock_tests_
 replicator module - Mock unit tests for the Replicator class
 """
 
+import json
 import mock
 import unittest
 
+from requests.exceptions import ChunkedEncodingError, HTTPError
+
+from cloudant._client_session import IAMSession
 from cloudant.database import CouchDatabase
-from cloudant.replicator import Replicator
+from cloudant.error import CloudantReplicatorException
+from cloudant.replicator import Replicator, _DOCUMENT_CACHE_SIZE
 
 from tests.unit.iam_auth_tests import MOCK_API_KEY
 
@@ -138,6 +143,43 @@ class ReplicatorDocumentValidationMockTests(unittest.TestCase):
         self.assertDictEqual(args[0], expected_doc)
         self.assertTrue(kwargs['throw_on_exists'])
 
+    def test_basic_auth_credentials_looked_up_once_per_client(self):
+        m_basic_auth_client = self.setUpClientMocks()
+        m_basic_auth_client.basic_auth_str.return_value = 'abc'
+
+        src = CouchDatabase(m_basic_auth_client, self.source_db)
+        tgt = CouchDatabase(m_basic_auth_client, self.target_db)
+
+        rep = Replicator(m_basic_auth_client)
+        rep.create_replication(
+            src, tgt, repl_id=self.repl_id, user_ctx=self.user_ctx)
+
+        # source and target share a client so its session is read once
+        self.assertEqual(m_basic_auth_client.session.call_count, 1)
+
+    def test_user_ctx_looked_up_per_replication(self):
+        m_admin_party_client = self.setUpClientMocks(admin_party=True)
+
+        other_user_ctx = {'name': 'bar', 'roles': ['researcher']}
+        m_replicator = mock.MagicMock()
+        m_creds = mock.PropertyMock(side_effect=[
+            {'user_ctx': self.user_ctx}, {'user_ctx': other_user_ctx}])
+        type(m_replicator).creds = m_creds
+        m_admin_party_client.__getitem__.return_value = m_replicator
+
+        src = CouchDatabase(m_admin_party_client, self.source_db)
+        tgt = CouchDatabase(m_admin_party_client, self.target_db)
+
+        rep = Replicator(m_admin_party_client)
+        rep.create_replication(src, tgt, repl_id='rep_test_1')
+        # the session user changes, e.g. after change_credentials
+        rep.create_replication(src, tgt, repl_id='rep_test_2')
+
+        kcall = m_replicator.create_document.call_args_list
+        self.assertEqual(kcall[0][0][0]['user_ctx'], self.user_ctx)
+        self.assertEqual(kcall[1][0][0]['user_ctx'], other_user_ctx)
+        self.assertEqual(m_creds.call_count, 2)
+
     def test_using_iam_auth_source_and_target(self):
         m_iam_auth_client = self.setUpClientMocks(iam_api_key=MOCK_API_KEY)
 
@@ -173,3 +215,276 @@ class ReplicatorDocumentValidationMockTests(unittest.TestCase):
 
         self.assertDictEqual(args[0], expected_doc)
         self.assertTrue(kwargs['throw_on_exists'])
+
+    def test_iam_api_key_is_serialized_as_a_value(self):
+        m_iam_auth_client = self.setUpClientMocks()
+        type(m_iam_auth_client).is_iam_authenticated = mock.PropertyMock(
+            return_value=True)
+        type(m_iam_auth_client).r_session = mock.PropertyMock(
+            return_value=IAMSession(MOCK_API_KEY, self.server_url))
+
+        m_replicator = mock.MagicMock()
+        m_iam_auth_client.__getitem__.return_value = m_replicator
+
+        src = CouchDatabase(m_iam_auth_client, self.source_db)
+        tgt = CouchDatabase(m_iam_auth_client, self.target_db)
+
+        rep = Replicator(m_iam_auth_client)
+        rep.create_replication(
+            src, tgt, repl_id=self.repl_id, user_ctx=self.user_ctx)
+
+        args, _ = m_replicator.create_document.call_args
+        # get_api_key is a session property so the key itself is stored
+        self.assertEqual(
+            args[0]['source']['auth']['iam']['api_key'], MOCK_API_KEY)
+        self.assertEqual(
+            args[0]['target']['auth']['iam']['api_key'], MOCK_API_KEY)
+
+
+class ReplicatorListMockTests(unittest.TestCase):
+    """
+    Replicator list_replications mock tests
+    """
+
+    def setUp(self):
+        self.m_client = mock.MagicMock()
+        self.m_replicator = self.m_client.__getitem__.return_value
+        self.m_replicator.database_name = '_replicator'
+        self.m_replicator.client.server_url = 'http://localhost:5984'
+        self.m_replicator.all_docs.return_value = {'rows': [
+            {'id': '_design/foo', 'doc': {'_id': '_design/foo'}},
+            {'id': 'rep_test', 'doc': {'_id': 'rep_test', '_rev': '1-abc'}}
+        ]}
+
+    def test_list_replications_skips_design_documents(self):
+        m_replicator = self.m_replicator
+
+        rep = Replicator(self.m_client)
+        docs = rep.list_replications()
+
+        m_replicator.all_docs.assert_called_once_with(include_docs=True)
+        self.assertEqual(len(docs), 1)
+        self.assertDictEqual(docs[0], {'_id': 'rep_test', '_rev': '1-abc'})
+        self.assertEqual(
+            docs[0].document_url, 'http://localhost:5984/_replicator/rep_test')
+
+    def test_list_replications_without_wrapping(self):
+        rep = Replicator(self.m_client)
+        docs = rep.list_replications(wrap=False)
+
+        self.assertEqual(docs, [{'_id': 'rep_test', '_rev': '1-abc'}])
+        self.assertIs(type(docs[0]), dict)
+
+
+class ReplicatorFollowMockTests(unittest.TestCase):
+    """
+    Replicator state, follow and stop mock tests
+    """
+
+    def setUp(self):
+        self.repl_id = 'rep_test'
+        self.m_client = mock.MagicMock()
+        self.m_client.features.return_value = []
+        self.m_replicator = self.m_client.__getitem__.return_value
+        self.m_replicator.database_name = '_replicator'
+        self.m_replicator.client.server_url = 'http://localhost:5984'
+        m_response = mock.MagicMock(status_code=404)
+        m_response.raise_for_status.side_effect = HTTPError(
+            response=m_response)
+        self.m_replicator.client.r_session.get.return_value = m_response
+
+    def _feed(self, changes, last_seq):
+        feed = mock.MagicMock()
+        feed.__iter__.return_value = iter(changes)
+        feed.last_seq = last_seq
+        return feed
+
+    def test_follow_replication_reads_state_from_changes(self):
+        self.m_replicator.changes.side_effect = [
+            self._feed([{'id': self.repl_id, 'seq': '1-a', 'doc': {
+                '_id': self.repl_id, '_replication_state': 'triggered'}}],
+                '1-a'),
+            self._feed([], '1-a'),
+            self._feed([{'id': self.repl_id, 'seq': '2-b', 'doc': {
+                '_id': self.repl_id, '_replication_state': 'completed'}}],
+                '2-b')
+        ]
+
+        rep = Replicator(self.m_client)
+        states = [doc['_replication_state']
+                  for doc in rep.follow_replication(self.repl_id)]
+
+        self.assertEqual(states, ['triggered', 'completed'])
+        self.assertEqual(
+            self.m_replicator.changes.call_args_list,
+            [mock.call(
+                feed='longpoll',
+                since=since,
+                timeout=10000,
+                filter='_doc_ids',
+                doc_ids=[self.repl_id],
+                include_docs=True
+            ) for since in (0, '1-a', '1-a')]
+        )
+        # the document is only requested once, before the feed is polled
+        self.m_replicator.client.r_session.get.assert_called_once_with(
+            'http://localhost:5984/_replicator/rep_test', headers=None)
+
+    def test_follow_replication_resumes_interrupted_feed(self):
+        def interrupted():
+            yield {'id': self.repl_id, 'seq': '1-a', 'doc': {
+                '_id': self.repl_id, '_replication_state': 'triggered'}}
+            raise ChunkedEncodingError()
+
+        m_interrupted = mock.MagicMock()
+        m_interrupted.__iter__.return_value = interrupted()
+        self.m_replicator.changes.side_effect = [
+            m_interrupted,
+            self._feed([{'id': self.repl_id, 'seq': '2-b', 'doc': {
+                '_id': self.repl_id, '_replication_state': 'completed'}}],
+                '2-b')
+        ]
+
+        rep = Replicator(self.m_client)
+        states = [doc['_replication_state']
+                  for doc in rep.follow_replication(self.repl_id)]
+
+        self.assertEqual(states, ['triggered', 'completed'])
+        self.assertEqual(
+            [kwargs['since'] for _, kwargs
+             in self.m_replicator.changes.call_args_list],
+            [0, '1-a']
+        )
+
+    def test_follow_replication_fetches_state_missing_from_change(self):
+        m_response = mock.MagicMock(encoding='utf-8')
+        m_response.text = json.dumps(
+            {'_id': self.repl_id, '_replication_state': 'completed'})
+        self.m_replicator.client.r_session.get.side_effect = [
+            self.m_replicator.client.r_session.get.return_value, m_response]
+        self.m_replicator.changes.return_value = self._feed(
+            [{'id': self.repl_id, 'seq': '1-a'}], '1-a')
+
+        rep = Replicator(self.m_client)
+        states = [doc['_replication_state']
+                  for doc in rep.follow_replication(self.repl_id)]
+
+        self.assertEqual(states, ['completed'])
+        self.assertEqual(self.m_replicator.client.r_session.get.call_count, 2)
+
+    def test_follow_replication_checks_scheduler_without_changes(self):
+        m_scheduler = mock.MagicMock()
+        m_scheduler.get_doc.side_effect = [
+            {'doc_id': self.repl_id, 'state': 'pending'},
+            {'doc_id': self.repl_id, 'state': 'pending'},
+            {'doc_id': self.repl_id, 'state': 'running'},
+            {'doc_id': self.repl_id, 'state': 'completed'}
+        ]
+        self.m_replicator.changes.side_effect = [
+            self._feed([], 0), self._feed([], 0), self._feed([], 0)]
+
+        rep = Replicator(self.m_client)
+        rep._scheduler_supported = True
+        rep._scheduler = m_scheduler
+        states = [doc['state'] for doc in rep.follow_replication(self.repl_id)]
+
+        # scheduler states are streamed once each, without document changes
+        self.assertEqual(states, ['pending', 'running', 'completed'])
+        self.assertEqual(self.m_replicator.changes.call_count, 3)
+
+    def test_follow_replication_in_terminal_state(self):
+        m_response = mock.MagicMock(encoding='utf-8')
+        m_response.text = json.dumps(
+            {'_id': self.repl_id, '_replication_state': 'failed'})
+        self.m_replicator.client.r_session.get.return_value = m_response
+
+        rep = Replicator(self.m_client)
+        docs = list(rep.follow_replication(self.repl_id))
+
+        self.assertEqual([doc['_replication_state'] for doc in docs],
+                         ['failed'])
+        # the changes feed is not polled for a finished replication
+        self.m_replicator.changes.assert_not_called()
+
+    def test_replication_state_uses_a_single_request(self):
+        m_response = mock.MagicMock(encoding='utf-8')
+        m_response.text = json.dumps(
+            {'_id': self.repl_id, '_replication_state': 'completed'})
+        self.m_replicator.client.r_session.get.return_value = m_response
+
+        rep = Replicator(self.m_client)
+
+        self.assertEqual(rep.replication_state(self.repl_id), 'completed')
+        self.m_replicator.client.r_session.get.assert_called_once_with(
+            'http://localhost:5984/_replicator/rep_test', headers=None)
+        self.m_replicator.client.r_session.head.assert_not_called()
+
+    def test_replication_state_uses_conditional_requests(self):
+        m_response = mock.MagicMock(
+            encoding='utf-8', status_code=200, headers={'ETag': '"1-abc"'})
+        m_response.text = json.dumps({'_id': self.repl_id, '_rev': '1-abc',
+                                      '_replication_state': 'triggered'})
+        m_not_modified = mock.MagicMock(status_code=304)
+        m_session = self.m_replicator.client.r_session
+        m_session.get.side_effect = [m_response, m_not_modified]
+
+        rep = Replicator(self.m_client)
+
+        self.assertEqual(rep.replication_state(self.repl_id), 'triggered')
+        self.assertEqual(rep.replication_state(self.repl_id), 'triggered')
+        self.assertEqual(m_session.get.call_args_list, [
+            mock.call('http://localhost:5984/_replicator/rep_test',
+                      headers=None),
+            mock.call('http://localhost:5984/_replicator/rep_test',
+                      headers={'If-None-Match': '"1-abc"'})
+        ])
+
+    def test_replication_state_keeps_a_bounded_number_of_documents(self):
+        def response(url, headers=None):
+            repl_id = url.rsplit('/', 1)[1]
+            m_response = mock.MagicMock(
+                encoding='utf-8', status_code=200, headers={'ETag': '"1-abc"'})
+            m_response.text = json.dumps({'_id': repl_id, '_rev': '1-abc',
+                                          '_replication_state': 'triggered'})
+            return m_response
+        m_session = self.m_replicator.client.r_session
+        m_session.get.side_effect = response
+
+        rep = Replicator(self.m_client)
+        repl_ids = ['rep_test{0:03d}'.format(i)
+                    for i in range(_DOCUMENT_CACHE_SIZE + 1)]
+        for repl_id in repl_ids:
+            rep.replication_state(repl_id)
+
+        self.assertEqual(list(rep._documents), repl_ids[1:])
+
+    def test_replication_state_of_missing_document(self):
+        rep = Replicator(self.m_client)
+
+        with self.assertRaises(CloudantReplicatorException) as cm:
+            rep.replication_state(self.repl_id)
+        self.assertEqual(cm.exception.status_code, 404)
+
+    def test_stop_replication_fetches_the_document_once(self):
+        m_response = mock.MagicMock(encoding='utf-8')
+        m_response.text = json.dumps({'_id': self.repl_id, '_rev': '1-abc'})
+        m_session = self.m_replicator.client.r_session
+        m_session.get.return_value = m_response
+
+        rep = Replicator(self.m_client)
+        rep.stop_replication(self.repl_id)
+
+        m_session.get.assert_called_once_with(
+            'http://localhost:5984/_replicator/rep_test', headers=None)
+        m_session.head.assert_not_called()
+        m_session.delete.assert_called_once_with(
+            'http://localhost:5984/_replicator/rep_test',
+            params={'rev': '1-abc'})
+
+    def test_stop_replication_of_missing_document(self):
+        rep = Replicator(self.m_client)
+
+        with self.assertRaises(CloudantReplicatorException) as cm:
+            rep.stop_replication(self.repl_id)
+        self.assertEqual(cm.exception.status_code, 404)
+        self.m_replicator.client.r_session.delete.assert_not_called()
@@ -179,6 +179,36 @@ class ResultTests(UnitTestDbBase):
             invalid_result = result[-1]
         self.assertEqual(cm.exception.status_code, 101)
 
+    def test_get_item_by_bool(self):
+        """
+        Test retrieving a result raises an exception when using a bool as an
+        index or as index slice values.
+        """
+        result = Result(self.view001)
+        with self.assertRaises(ResultException) as cm:
+            invalid_result = result[True]
+        self.assertEqual(cm.exception.status_code, 101)
+
+        with self.assertRaises(ResultException) as cm:
+            invalid_result = result[False: 10]
+        self.assertEqual(cm.exception.status_code, 101)
+
+    def test_get_item_with_cache(self):
+        """
+        Test that repeated key access and slicing is served from the cache
+        when a cache size is set.
+        """
+        result = Result(self.view001, cache_size=2)
+        rows = result['julia010']
+        self.assertEqual(
+            rows, [{'key': 'julia010', 'id': 'julia010', 'value': 1}])
+        self.assertIs(result['julia010'], rows)
+        rows = result[0:2]
+        self.assertIs(result[0:2], rows)
+        result.cache_clear()
+        self.assertIsNot(result[0:2], rows)
+        self.assertEqual(result[0:2], rows)
+
     def test_get_item_by_key_using_invalid_options(self):
         """
         Since the __getitem__ method uses the 'key' parameter to retrieve the
@@ -589,6 +619,11 @@ class ResultTests(UnitTestDbBase):
             invalid_result = [row for row in result]
         self.assertEqual(cm.exception.status_code, 104)
 
+        result = Result(self.view001, page_size=None)
+        with self.assertRaises(ResultException) as cm:
+            invalid_result = [row for row in result]
+        self.assertEqual(cm.exception.status_code, 104)
+
     def test_iteration_using_valid_page_size(self):
         """
         Test that iteration works as expected when "page_size" is provided as
@@ -635,6 +670,33 @@ class ResultTests(UnitTestDbBase):
         result = Result(self.view001, startkey='ruby')
         self.assertEqual([x for x in result], [])
 
+    def test_iteration_repeated(self):
+        """
+        Test that a result can be iterated more than once from the same
+        starting key.
+        """
+        result = Result(self.view001, startkey='julia002', endkey='julia004',
+                        page_size=2)
+        expected = [{'key': 'julia002', 'id': 'julia002', 'value': 1},
+                    {'key': 'julia003', 'id': 'julia003', 'value': 1},
+                    {'key': 'julia004', 'id': 'julia004', 'value': 1}]
+        self.assertEqual([x for x in result], expected)
+        self.assertEqual([x for x in result], expected)
+        self.assertDictEqual(result.options,
+                             {'startkey': 'julia002', 'endkey': 'julia004'})
+
+    def test_iteration_over_docs(self):
+        """
+        Test that iterating over the result documents includes the documents
+        with the result rows.
+        """
+        result = Result(self.view001, endkey='julia002', page_size=2)
+        self.assertEqual(
+            [doc['_id'] for doc in result.docs()],
+            ['julia000', 'julia001', 'julia002']
+        )
+        self.assertDictEqual(result.options, {'endkey': 'julia002'})
+
     def test_iteration_integer_keys(self):
         """
         Test that iteration works as expected when keys are integer.
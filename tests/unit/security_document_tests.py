@@ -22,6 +22,8 @@ module docstring.
 import json
 import unittest
 
+import mock
+
 from cloudant.security_document import SecurityDocument
 from nose.plugins.attrib import attr
 
@@ -109,7 +111,30 @@ class SecurityDocumentTests(UnitTestDbBase):
         mod_sdoc = SecurityDocument(self.db)
         mod_sdoc.fetch()
         self.assertDictEqual(mod_sdoc, self.mod_sdoc)
-    
+
+    def test_context_manager_without_changes(self):
+        """
+        Test that the SecurityDocument context manager does not save a
+        security document that has not been changed.
+        """
+        with mock.patch.object(self.db.r_session, 'put') as m_put:
+            with SecurityDocument(self.db) as sdoc:
+                self.assertDictEqual(sdoc, self.sdoc)
+            m_put.assert_not_called()
+
+    def test_context_manager_with_nested_changes(self):
+        """
+        Test that the SecurityDocument context manager saves changes made
+        within the nested structures of the security document.
+        """
+        with SecurityDocument(self.db) as sdoc:
+            for key in self.mod_sdoc:
+                sdoc[key].clear()
+                sdoc[key].update(self.mod_sdoc[key])
+        mod_sdoc = SecurityDocument(self.db)
+        mod_sdoc.fetch()
+        self.assertDictEqual(mod_sdoc, self.mod_sdoc)
+
 
 if __name__ == '__main__':
     unittest.main()